@@ -211,8 +211,7 @@ def conc2df(concfile, row_select=None, file_format=None, header=True):
     elif file_format == 'tab':
         df = pd.read_csv(concfile, sep='\t', header=header)
     elif file_format == 'excel':
-        xls = pd.ExcelFile(concfile)
-        df = pd.read_excel(xls, header=header)
+        df = pd.read_excel(concfile, header=header)
     else:
         raise ValueError('Concentration file not in usable format')
 
@@ -263,7 +262,7 @@ def check_rack_labels(df_conc):
     """
     cols = ['TECAN_labware_name', 'TECAN_dest_labware_name']
     for x in cols:
-        df_conc[x] = [y.replace('.', '_') for y in df_conc[x].tolist()]
+        df_conc[x] = df_conc[x].astype(str).str.replace('.', '_', regex=False)
     return df_conc
             
 def calc_final_volume(row, dilute_conc, min_vol, max_vol, min_total, max_total): 
@@ -378,13 +377,13 @@ def add_dest(df_conc, dest_name, dest_type,  dest_wells=96):
     dest_wells = int(dest_wells)
 
     # creating dest_name column; possibly multiple names
-    n_dest_plates = int(round(df_conc.shape[0] / dest_wells + 0.5, 0))
+    n_dest_plates = -(-df_conc.shape[0] // dest_wells)
     
     ## destination plate names
     if n_dest_plates > 1:
         dest_names = []
         for i in range(df_conc.shape[0]):
-            x = int(round(i / dest_wells + 0.50001, 0))
+            x = i // dest_wells + 1
             dest_names.append(dest_name + '[{:0>3}]'.format(x))   
         df_conc['TECAN_dest_labware_name'] = dest_names
     else:
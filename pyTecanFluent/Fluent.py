@@ -5,6 +5,7 @@ import os
 import sys
 import re
 import json
+import functools
 import collections
 import pkg_resources
 import numpy as np
@@ -24,6 +25,17 @@ def xstr(x):
         return x
 
 
+@functools.lru_cache(maxsize=None)
+def load_database(file_name):
+    """Loading a JSON database file from the package database directory.
+    Cached: each file is only parsed once, and the returned dict is shared
+    by all callers, so do not modify it
+    """
+    d = os.path.join(os.path.split(__file__)[0], 'database')
+    with open(os.path.join(d, file_name)) as inF:
+        return json.load(inF)
+
+
 class db(object):
     """Database of FluentControl labware, tip types, liquid classes, etc.
     Database files are stored in JSON format
@@ -32,26 +44,18 @@ class db(object):
         d = os.path.split(__file__)[0]
         self.database_dir = os.path.join(d, 'database')
         # labware
-        f = os.path.join(self.database_dir, 'labware.json')
-        with open(f) as inF:
-            self.labware = json.load(inF)
+        self.labware = load_database('labware.json')
         # tip type
-        f = os.path.join(self.database_dir, 'tip_type.json')
-        with open(f) as inF:
-            self.tip_type = json.load(inF)
+        self.tip_type = load_database('tip_type.json')
         # liquid class
-        f = os.path.join(self.database_dir, 'liquid_class.json')
-        with open(f) as inF:
-            self.liquid_class = json.load(inF)
+        self.liquid_class = load_database('liquid_class.json')
 
     def RackTypes(self):
         return list(self.labware.keys())
             
     def get_labware(self, value):
         try:
-            d = self.labware[value]
-            d['RackType'] = value
-            return d
+            return dict(self.labware[value], RackType=value)
         except KeyError:
             msg = 'Labware not in database: "{}"'
             raise KeyError(msg.format(value))
@@ -272,6 +276,11 @@ class asp_disp(object):
     TipMask
     ForceRackType
     """
+    # fixed attribute set; many of these objects are created per worklist
+    __slots__ = ('_ID', 'db', 'RackLabel', 'RackID', 'RackType',
+                 '_Position', 'TubeID', 'Volume', '_LiquidClass',
+                 'TipType', 'TipMask', 'ForceRackType', 'field_order')
+    
     def __init__(self, RackLabel=None, RackID=None, RackType=None,
                  Position=1, TubeID=None, Volume=None,
                  LiquidClass = 'Water Free Single', TipType=None,
@@ -328,6 +337,8 @@ class asp_disp(object):
 class Aspirate(asp_disp):
     """gwl aspirate command: "A;"
     """
+    __slots__ = ()
+    
     def __init__(self):
         asp_disp.__init__(self)
         self._ID = 'A'
@@ -335,6 +346,8 @@ class Aspirate(asp_disp):
 class Dispense(asp_disp):
     """gwl dispense command: "D;"
     """
+    __slots__ = ()
+    
     def __init__(self):
         asp_disp.__init__(self)
         self._ID = 'D'
@@ -2,9 +2,7 @@ from __future__ import print_function
 
 # import
 ## batteries
-import os
 import sys
-import json
 import string
 import itertools
 import collections
@@ -20,11 +18,8 @@ class utils(object):
     """
 
     def __init__(self):
-        # target position
-        d = os.path.join(os.path.split(__file__)[0],  'database')
-        f = os.path.join(d, 'labware.json')
-        with open(f) as inF:
-            self.labware = json.load(inF)
+        # labware
+        self.labware = Fluent.load_database('labware.json')
 
     def get_wells(self, RackType):
         """Getting wells of RackType
@@ -122,10 +117,7 @@ class labware(object):
         self.labware = {} 
         self.labware_order = {}
         # target position
-        d = os.path.join(os.path.split(__file__)[0],  'database')
-        f = os.path.join(d, 'target_position.json')
-        with open(f) as inF:
-            self.target_position = json.load(inF)
+        self.target_position = Fluent.load_database('target_position.json')
                 
     def add_gwl(self, gwl):
         """Adding labware from gwl object to labware object.
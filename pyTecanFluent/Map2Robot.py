@@ -6,7 +6,7 @@ import re
 import sys
 import argparse
 import functools
-from itertools import product,cycle
+from itertools import cycle
 ## 3rd party
 import numpy as np
 import pandas as pd
@@ -279,8 +279,7 @@ def map2df(mapfile, row_select=None):
     elif mapfile.endswith('.csv'):
         df = pd.read_csv(mapfile, sep=',')
     elif mapfile.endswith('.xls') or mapfile.endswith('.xlsx'):
-        xls = pd.ExcelFile(mapfile)
-        df = pd.read_excel(xls)
+        df = pd.read_excel(mapfile)
     else:
         raise ValueError('Mapping file not in usable format')
 
@@ -345,7 +344,7 @@ def check_rack_labels(df_map):
     """
     cols = ['TECAN_sample_labware_name', 'TECAN_primer_labware_name', 'TECAN_dest_labware_name']
     for x in cols:
-        df_map[x] = [y.replace('.', '_') for y in df_map[x].tolist()]
+        df_map[x] = df_map[x].astype(str).str.replace('.', '_', regex=False)
     return df_map
         
 def add_dest(df_map, dest_labware,
@@ -373,12 +372,10 @@ def add_dest(df_map, dest_labware,
             'TECAN_dest_labware_name',
             'TECAN_dest_labware_type', 
             'TECAN_dest_target_position']    
-    ncol = len(cols)
     nrow = df_map.shape[0] * rxn_reps        # number of rxns
-    df_dest = pd.DataFrame(np.nan, index=range(nrow), columns=cols)
 
     # number of destination plates required
-    n_dest_plates = round(df_dest.shape[0] / positions + 0.5, 0)
+    n_dest_plates = -(-(nrow + dest_start - 1) // positions)
     if n_dest_plates > 1:
         msg = ('WARNING: Not enough wells for the number of samples.' 
         ' Using multiple destination plates')
@@ -386,19 +383,21 @@ def add_dest(df_map, dest_labware,
         
     
     # filling destination df
-    orig_dest_labware = dest_labware
-    for i,(sample,rep) in enumerate(product(df_map.iloc[:,0], range(rxn_reps))):
-        # dest location
-        dest_position = i + dest_start
-        dest_position = positions if dest_position % positions == 0 else dest_position % positions 
-
-        # destination plate name
-        if n_dest_plates > 1:
-            x = round((i + dest_start) / positions + 0.499, 0)        
-            dest_labware = '{} {}'.format(orig_dest_labware, int(x))
-
-        # adding values DF
-        df_dest.iloc[i] = [sample, rep+1, dest_labware, dest_type, dest_position]
+    ## dest location
+    dest_idx = np.arange(nrow) + dest_start
+    dest_positions = (dest_idx - 1) % positions + 1
+    ## destination plate name (integer ceiling of dest_idx / positions)
+    if n_dest_plates > 1:
+        plate_idx = -(-dest_idx // positions)
+        dest_labware = ['{} {}'.format(dest_labware, x) for x in plate_idx]
+    ## adding values DF (each sample repeated rxn_reps times)
+    df_dest = pd.DataFrame({sample_col : np.repeat(df_map.iloc[:,0].values, rxn_reps),
+                            'TECAN_pcr_rxn_rep' : np.tile(np.arange(rxn_reps) + 1,
+                                                          df_map.shape[0]),
+                            'TECAN_dest_labware_name' : dest_labware,
+                            'TECAN_dest_labware_type' : dest_type,
+                            'TECAN_dest_target_position' : dest_positions},
+                           columns=cols)
 
     # df join (map + destination)
     df_j = pd.merge(df_map, df_dest, on=sample_col, how='inner')
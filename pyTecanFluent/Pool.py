@@ -14,6 +14,9 @@ from pyTecanFluent import Utils
 from pyTecanFluent import Fluent
 from pyTecanFluent import Labware
 
+# allowed values in the sample include column
+_PSBL_VALS = frozenset(('success', 'include', 'pass', 'fail', 'skip'))
+
 # functions
 def get_desc():
     desc = 'Create robot commands for pooling samples'
@@ -138,7 +141,7 @@ def main(args=None):
                             row_select=args.sample_rows, 
                             header=args.sample_header)
         df_samps.append(df_samp)
-    df_samp = pd.concat(df_samps)
+    df_samp = pd.concat(df_samps, ignore_index=True)
     
     ## mapping file
     df_map = map2df(args.mapfile,                    
@@ -256,8 +259,7 @@ def sample2df(samplefile, sample_col, include_col,
     elif file_format == 'tab':
         df = pd.read_csv(samplefile, sep='\t', header=header)
     elif file_format == 'excel':
-        xls = pd.ExcelFile(samplefile)
-        df = pd.read_excel(xls, header=header)
+        df = pd.read_excel(samplefile, header=header)
     else:
         raise ValueError('Sample file is not in a usable format')
 
@@ -271,15 +273,19 @@ def sample2df(samplefile, sample_col, include_col,
         if req_col not in df.columns.values:
             raise ValueError(msg.format(req_col))    
     ## include col
-    f = lambda x: x.lower()
-    df.loc[:,include_col] = df.loc[:,include_col].apply(f)
-    msg = '"{}" value not allowed in include column in sample file'
-    df.loc[:,include_col].apply(check_include_column)
-    ## converting wells to positions
+    df[include_col] = df[include_col].str.lower().astype('category')
+    bad_vals = ~df[include_col].isin(_PSBL_VALS)
+    if bad_vals.any():
+        msg = '"{}" value not allowed in include column in sample file'
+        raise ValueError(msg.format(df.loc[bad_vals, include_col].iloc[0]))
+    ## converting wells to positions (one lookup per unique well per RackType)
     lw_utils = Labware.utils()
-    f = lambda row: lw_utils.well2position(row[position_col],
-                                           RackType=row[labware_type_col])
-    df[position_col] = df.apply(f, axis=1)
+    positions = []
+    for rack_type,df_rack in df.groupby(labware_type_col, sort=False, dropna=False):
+        wells = pd.unique(df_rack[position_col])
+        idx = {x:lw_utils.well2position(x, RackType=rack_type) for x in wells}
+        positions.append(df_rack[position_col].map(idx))
+    df[position_col] = pd.concat(positions)
 
     # selecting relevant columns
     df = df.loc[:,req_cols]
@@ -290,16 +296,12 @@ def sample2df(samplefile, sample_col, include_col,
     # return
     return df
 
-def check_include_column(x):
-    psbl_vals = ('success', 'include', 'pass', 'fail', 'skip')
-    assert x in psbl_vals, msg.format(x)
-
 def check_rack_labels(df_samp):
     """Removing '.' for rack labels (causes execution failures)
     """
     cols = ['labware_name', 'TECAN_dest_labware_name']
     for x in cols:
-        df_samp[x] = [y.replace('.', '_') for y in df_samp[x].tolist()]
+        df_samp[x] = df_samp[x].astype(str).str.replace('.', '_', regex=False)
     return df_samp
     
 def map2df(mapfile, file_format=None, header=True):
@@ -328,8 +330,7 @@ def map2df(mapfile, file_format=None, header=True):
     elif file_format == 'tab':
         df = pd.read_csv(mapfile, sep='\t', header=header)
     elif file_format == 'excel':
-        xls = pd.ExcelFile(mapfile)
-        df = pd.read_excel(xls, header=header)
+        df = pd.read_excel(mapfile, header=header)
     else:
         raise ValueError('Mapping file is not in a usable format')
     
@@ -350,8 +351,14 @@ def add_dest(df, dest_labware, sample_col, position_col, labware_name_col,
     Add destination location columns:
       [dest_labware_name, dest_labware_type, dest_location]
     """
-    df.reset_index(inplace=True)
     assert isinstance(dest_start, int)
+    # rows lacking a sample name cannot be pooled
+    missing = df[sample_col].isnull()
+    if missing.any():
+        msg = 'WARNING: skipping {} rows with no sample name\n'
+        sys.stderr.write(msg.format(missing.sum()))
+        df = df.loc[~missing]
+    df = df.reset_index()
     # number of wells in destination plate type
     lw_utils = Labware.utils()
     n_dest_wells = lw_utils.get_wells(dest_type)
@@ -359,37 +366,19 @@ def add_dest(df, dest_labware, sample_col, position_col, labware_name_col,
         msg = 'RackType has no "wells" value: "{}"'
         raise ValueError(msg.format(dest_type))
 
-    # number of samples in final pool
-    n_samples = len(df['Sample'].unique())
-    
-    # init destination df
-    df['TECAN_dest_labware_name'] = ''
-    df['TECAN_dest_labware_type'] = ''
-    df['TECAN_dest_target_position'] = np.nan
-
-    # iterating through df and adding dest
-    dest_pos_idx = {}
-    cur_pos = dest_start
-    dest_plate_cnt = 1
-    for i in range(df.shape[0]):
-        # sample destination position
-        cur_sample = df.loc[i,'Sample']
-        try:
-            # destination location for that sample
-            dest_pos_tmp = dest_pos_idx[cur_sample]
-        except KeyError:
-            x = ['{0}[{1:0>3}]'.format(dest_labware, dest_plate_cnt), cur_pos]
-            dest_pos_idx[cur_sample] = x
-            cur_pos += 1
-        # destination labware name
-        ## dest row
-        df.at[i,'TECAN_dest_labware_name'] = dest_pos_idx[cur_sample][0]
-        df.at[i,'TECAN_dest_labware_type'] =  dest_type
-        df.at[i,'TECAN_dest_target_position'] = dest_pos_idx[cur_sample][1]
-        # next plate
-        if cur_pos > n_dest_wells:
-            cur_pos = 1
-            dest_plate_cnt += 1
+    # destination slot for each sample (ordered by first appearance)
+    sample_idx,_ = pd.factorize(df[sample_col])
+    slots = sample_idx + dest_start - 1
+    ## slots fill the first plate from dest_start, then each new plate from 1
+    plate_idx = slots // n_dest_wells + 1
+    positions = slots % n_dest_wells + 1
+
+    # adding destination columns
+    plates,plate_inv = np.unique(plate_idx, return_inverse=True)
+    plate_names = ['{0}[{1:0>3}]'.format(dest_labware, x) for x in plates]
+    df['TECAN_dest_labware_name'] = np.array(plate_names, dtype=object)[plate_inv]
+    df['TECAN_dest_labware_type'] = dest_type
+    df['TECAN_dest_target_position'] = positions.astype(float)
 
     #df.to_csv(sys.stdout, sep='\t'); sys.exit()
     return df
@@ -403,21 +392,30 @@ def pool_samples(df, gwl, sample_col, labware_name_col,
     """
     gwl.add(Fluent.Comment('Sample pooling'))
     
+    # column values (indexed by row position)
+    lw_names = df[labware_name_col].to_numpy()
+    lw_types = df[labware_type_col].to_numpy()
+    positions = df[position_col].to_numpy()
+    if volume_col.lower() == 'none':
+        volumes = np.full(df.shape[0], volume, dtype=float)
+    else:
+        volumes = df[volume_col].to_numpy()
+    dest_names = df['TECAN_dest_labware_name'].to_numpy()
+    dest_types = df['TECAN_dest_labware_type'].to_numpy()
+    dest_positions = df['TECAN_dest_target_position'].to_numpy()
+    ## row positions for each sample
+    sample_rows = df.groupby(sample_col, sort=False).indices
+    
     # for each Sample, generate asp/dispense commands
     ## optional: keep tips among sample replicates
     for sample in df[sample_col].unique():
-        df_sub = df.loc[df[sample_col] == sample]
-        df_sub.index = range(df_sub.shape[0])
-        for i in range(df_sub.shape[0]):
+        for i in sample_rows.get(sample, []):
             # aspiration
             asp = Fluent.Aspirate()
-            asp.RackLabel = df_sub.loc[i, labware_name_col]
-            asp.RackType = df_sub.loc[i, labware_type_col]
-            asp.Position = df_sub.loc[i, position_col]
-            if volume_col.lower() == 'none':
-                asp.Volume = volume
-            else:
-                asp.Volume = df_sub.loc[i, volume_col]
+            asp.RackLabel = lw_names[i]
+            asp.RackType = lw_types[i]
+            asp.Position = positions[i]
+            asp.Volume = volumes[i]
             if asp.Volume <= 0:
                 msg = 'WARNING: skipping sample because volume <= 0\n'
                 sys.stderr.write(msg)
@@ -427,9 +425,9 @@ def pool_samples(df, gwl, sample_col, labware_name_col,
 
             # dispensing
             disp = Fluent.Dispense()
-            disp.RackLabel = df_sub.loc[i,'TECAN_dest_labware_name']
-            disp.RackType = df_sub.loc[i,'TECAN_dest_labware_type']
-            disp.Position = df_sub.loc[i,'TECAN_dest_target_position']
+            disp.RackLabel = dest_names[i]
+            disp.RackType = dest_types[i]
+            disp.Position = dest_positions[i]
             disp.Volume = asp.Volume
             disp.LiquidClass = liq_cls
             gwl.add(disp)
@@ -456,7 +454,13 @@ def filter_samp(df_samp, sample_col):
                        'TECAN_postPool_target_position']
     sort_vals = ['TECAN_postPool_labware_name',
                  'TECAN_postPool_target_position']
-    df_samp.sort_values(sort_vals, inplace=True)
+    # skip the sort if destinations are already in order (no 384-well reordering):
+    ## plate names non-decreasing & positions non-decreasing within each plate
+    names = df_samp[sort_vals[0]]
+    same_plate = names.values[1:] == names.values[:-1]
+    pos_diff = np.diff(df_samp[sort_vals[1]].values)
+    if not (names.is_monotonic_increasing and (pos_diff[same_plate] >= 0).all()):
+        df_samp.sort_values(sort_vals, inplace=True)
     return(df_samp)
     
         
@@ -468,9 +472,10 @@ def filter_map(df_map, df_samp, sample_col):
     df_samp = filter_samp(df_samp, sample_col)
     # formatting mapping table
     df_map = df_map.drop_duplicates(subset='#SampleID')
-    # joining 
-    df_map = pd.merge(df_map, df_samp, how='inner',
-                      left_on=['#SampleID'], right_on=[sample_col])
+    # joining on the (unique) sample index; keeping the sample column
+    df_samp = df_samp.set_index(sample_col, drop=sample_col == '#SampleID')
+    df_map = df_map.join(df_samp, on='#SampleID', how='inner',
+                         lsuffix='_x', rsuffix='_y')
     # sorting by destination position
     df_map.sort_values('TECAN_postPool_target_position', inplace=True)
     return df_map
@@ -203,8 +203,7 @@ def load_setup(input_file, file_format=None, header=0):
     elif file_format == 'tab':
         df = pd.read_csv(input_file, sep='\t', header=header)
     elif file_format == 'excel':
-        xls = pd.ExcelFile(input_file)
-        df = pd.read_excel(xls, header=header)
+        df = pd.read_excel(input_file, header=header)
     else:
         raise ValueError('Setup file not in usable format')
     
@@ -263,7 +262,7 @@ def check_rack_labels(df_setup):
     """
     cols = ['sample labware name', 'mm name', 'dest_labware_name']
     for x in cols:
-        df_setup[x] = [str(y).replace('.', '_') for y in df_setup[x].tolist()]
+        df_setup[x] = df_setup[x].astype(str).str.replace('.', '_', regex=False)
     return df_setup
         
 def plate2robot_loc(row_val, col_val, n_wells):
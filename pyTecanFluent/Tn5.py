@@ -451,8 +451,7 @@ def map2df(mapfile, args, row_select=None):
     elif mapfile.endswith('.csv'):
         df = pd.read_csv(mapfile, sep=',')
     elif mapfile.endswith('.xls') or mapfile.endswith('.xlsx'):
-        xls = pd.ExcelFile(mapfile)
-        df = pd.read_excel(xls)
+        df = pd.read_excel(mapfile)
     else:
         raise ValueError('Mapping file not in usable format')
 
@@ -544,7 +543,7 @@ def check_rack_labels(df_map):
             'TECAN_primer_labware_name',
             'TECAN_dest_labware_name']
     for x in cols:
-        df_map[x] = [y.replace('.', '_') for y in df_map[x].tolist()]
+        df_map[x] = df_map[x].astype(str).str.replace('.', '_', regex=False)
     return df_map
         
 def add_dest(df_map, dest_labware, dest_type='384 Well Biorad PCR', dest_start=1):
@@ -566,31 +565,29 @@ def add_dest(df_map, dest_labware, dest_type='384 Well Biorad PCR', dest_start=1
             'TECAN_dest_labware_name',
             'TECAN_dest_labware_type', 
             'TECAN_dest_target_position']    
-    ncol = len(cols)
     nrow = df_map.shape[0] 
-    df_dest = pd.DataFrame(np.nan, index=range(nrow), columns=cols)
 
     # number of destination plates required
-    n_dest_plates = round(df_dest.shape[0] / positions + 0.5, 0)
+    n_dest_plates = -(-(nrow + dest_start - 1) // positions)
     if n_dest_plates > 1:
         msg = ('WARNING: Not enough wells for the number of samples.' 
         ' Using multiple destination plates')
         print(msg, file=sys.stderr)
             
     # filling destination df
-    orig_dest_labware = dest_labware
-    for i,sample in enumerate(df_map['SampleID']):
-        # dest location
-        dest_position = i + dest_start
-        dest_position = positions if dest_position % positions == 0 else dest_position % positions 
-
-        # destination plate name
-        if n_dest_plates > 1:
-            x = round((i + dest_start) / positions + 0.499, 0)        
-            dest_labware = '{} {}'.format(orig_dest_labware, int(x))
-
-        # adding values DF
-        df_dest.iloc[i] = [sample, dest_labware, dest_type, dest_position]
+    ## dest location
+    dest_idx = np.arange(nrow) + dest_start
+    dest_positions = (dest_idx - 1) % positions + 1
+    ## destination plate name (integer ceiling of dest_idx / positions)
+    if n_dest_plates > 1:
+        plate_idx = -(-dest_idx // positions)
+        dest_labware = ['{} {}'.format(dest_labware, x) for x in plate_idx]
+    ## adding values DF
+    df_dest = pd.DataFrame({sample_col : df_map['SampleID'].values,
+                            'TECAN_dest_labware_name' : dest_labware,
+                            'TECAN_dest_labware_type' : dest_type,
+                            'TECAN_dest_target_position' : dest_positions},
+                           columns=cols)
 
     # df join (map + destination)
     assert df_map.shape[0] == df_dest.shape[0], 'df_map and df_dest are different lengths' 
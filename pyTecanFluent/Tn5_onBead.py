@@ -227,8 +227,7 @@ def map2df(mapfile, args, row_select=None):
     elif mapfile.endswith('.csv'):
         df = pd.read_csv(mapfile, sep=',')
     elif mapfile.endswith('.xls') or mapfile.endswith('.xlsx'):
-        xls = pd.ExcelFile(mapfile)
-        df = pd.read_excel(xls)
+        df = pd.read_excel(mapfile)
     else:
         raise ValueError('Mapping file not in usable format')
 
@@ -322,7 +321,7 @@ def check_rack_labels(df_map):
             'TECAN_primer_labware_name',
             'TECAN_dest_labware_name']
     for x in cols:
-        df_map[x] = [y.replace('.', '_') for y in df_map[x].tolist()]
+        df_map[x] = df_map[x].astype(str).str.replace('.', '_', regex=False)
     return df_map
         
 def add_dest(df_map):#, dest_labware, dest_type='384 Well Biorad PCR', dest_start=1):
@@ -7,7 +7,7 @@ import glob
 
 requirements = [
     'numpy',
-    'pandas',
+    'pandas>=1.1.0',
     'xlrd'
 ]
 
@@ -26,3 +26,20 @@ def test_basic(script_runner, tmp_path):
                             '--prefix', output_prefix, conc_file)
     assert ret.success
 
+
+def test_add_dest_full_plate():
+    cols = ['TECAN_labware_name', 'TECAN_labware_type', 'TECAN_target_position',
+            'TECAN_sample_conc', 'TECAN_sample_volume', 'TECAN_dilutant_volume',
+            'TECAN_total_volume', 'TECAN_final_conc']
+    # exactly one 96-well plate
+    df_conc = pd.DataFrame(1, index=range(96), columns=cols)
+    df = Dilute.add_dest(df_conc, 'Diluted sample plate', '96 Well Eppendorf TwinTec PCR')
+    assert df['TECAN_dest_labware_name'].unique().tolist() == ['Diluted sample plate']
+    assert df['TECAN_dest_target_position'].tolist() == list(range(1, 97))
+    # one more sample requires a 2nd plate
+    df_conc = pd.DataFrame(1, index=range(97), columns=cols)
+    df = Dilute.add_dest(df_conc, 'Diluted sample plate', '96 Well Eppendorf TwinTec PCR')
+    x = df.groupby('TECAN_dest_labware_name')['TECAN_dest_target_position']
+    assert x.count().to_dict() == {'Diluted sample plate[001]' : 96,
+                                   'Diluted sample plate[002]' : 1}
+    assert df['TECAN_dest_target_position'].tolist()[-2:] == [96, 1]
@@ -40,3 +40,22 @@ def test_single_barcode(script_runner, tmp_path):
                             output_prefix, map_file)
     assert ret.success
         
+
+def test_add_dest_full_plate():
+    # 32 samples x 3 replicates = exactly one 96-well plate
+    df_map = pd.DataFrame({'#SampleID' : ['S{}'.format(i) for i in range(32)]})
+    df = Map2Robot.add_dest(df_map, 'Destination plate')
+    assert df.shape[0] == 96
+    assert df['TECAN_dest_labware_name'].unique().tolist() == ['Destination plate']
+    assert df['TECAN_dest_target_position'].tolist() == list(range(1, 97))
+    # one more sample requires a 2nd plate
+    df_map = pd.DataFrame({'#SampleID' : ['S{}'.format(i) for i in range(33)]})
+    df = Map2Robot.add_dest(df_map, 'Destination plate')
+    assert df['TECAN_dest_labware_name'].unique().tolist() == ['Destination plate 1',
+                                                              'Destination plate 2']
+    # starting at well 10: rows past well 96 go to a 2nd plate
+    df_map = pd.DataFrame({'#SampleID' : ['S{}'.format(i) for i in range(32)]})
+    df = Map2Robot.add_dest(df_map, 'Destination plate', dest_start=10)
+    x = df.groupby('TECAN_dest_labware_name')['TECAN_dest_target_position']
+    assert x.min().to_dict() == {'Destination plate 1' : 10, 'Destination plate 2' : 1}
+    assert x.max().to_dict() == {'Destination plate 1' : 96, 'Destination plate 2' : 9}
@@ -38,3 +38,25 @@ def test_map(script_runner, tmp_path):
                             pcr1_file, pcr2_file)
     assert ret.success
     
+
+def test_include_col_values(tmp_path):
+    pcr_file = os.path.join(data_dir, 'PCR-run1.xlsx')
+    df = pd.read_excel(pcr_file)
+    df.loc[0, 'Call'] = 'Maybe'
+    bad_file = os.path.join(str(tmp_path), 'bad_call.txt')
+    df.to_csv(bad_file, sep='\t', index=False)
+    with pytest.raises(ValueError):
+        Pool.sample2df(bad_file, sample_col='Sample', include_col='Call',
+                       labware_name_col='labware_name',
+                       labware_type_col='labware_type',
+                       position_col='Well', volume_col='None')
+
+def test_add_dest_missing_sample():
+    df = pd.DataFrame({'Sample' : ['S1', None, 'S2', 'S1', None],
+                       'labware_name' : 'Plate1',
+                       'Well' : [1, 2, 3, 4, 5]})
+    df = Pool.add_dest(df, dest_labware='P', sample_col='Sample',
+                       position_col='Well', labware_name_col='labware_name')
+    assert df['Sample'].tolist() == ['S1', 'S2', 'S1']
+    assert df['TECAN_dest_labware_name'].unique().tolist() == ['P[001]']
+    assert df['TECAN_dest_target_position'].tolist() == [1, 2, 1]